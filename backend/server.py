@@ -1,13 +1,26 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Depends, status, UploadFile, File
+from fastapi import FastAPI, APIRouter, HTTPException, Depends, status, UploadFile, File, Request, Response
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse, StreamingResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
+from starlette.middleware.gzip import GZipMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ReturnDocument, WriteConcern
+from pymongo.errors import DuplicateKeyError
+import asyncio
+import base64
+import csv
+import hashlib
+import hmac
+import io
 import os
+import re
 import logging
 import json
-import requests
+import threading
+import time
+from collections import OrderedDict
+import httpx
 import aiofiles
 import shutil
 from pathlib import Path
@@ -15,28 +28,55 @@ from pydantic import BaseModel, Field, EmailStr
 from typing import List, Optional, Dict, Any
 import uuid
 from datetime import datetime, timedelta, timezone
-from passlib.context import CryptContext
-from jose import JWTError, jwt
+import bcrypt
+import jwt
+import orjson
 import secrets
 
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:  # uvloop is optional (not available on all platforms)
+    pass
+
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
-# MongoDB connection
+# MongoDB connection — one shared client; pool bounds keep connection churn
+# down under load without exhausting mongod on small instances
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+client = AsyncIOMotorClient(
+    mongo_url,
+    maxPoolSize=int(os.environ.get('MONGO_MAX_POOL_SIZE', 50)),
+    minPoolSize=int(os.environ.get('MONGO_MIN_POOL_SIZE', 5)),
+    maxIdleTimeMS=30000,
+    serverSelectionTimeoutMS=2000,
+    waitQueueTimeoutMS=1000,
+)
 db = client[os.environ['DB_NAME']]
 
+# Reset tokens are short-lived and recreatable, so their inserts don't need
+# to wait on the journal fsync
+password_resets_relaxed = db.password_resets.with_options(
+    write_concern=WriteConcern(w=1, j=False)
+)
+
+# CORS origins, parsed once at import time
+CORS_ORIGINS = os.environ.get('CORS_ORIGINS', '*').split(',')
+
 # Security
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 SECRET_KEY = os.environ.get("SECRET_KEY", secrets.token_urlsafe(32))
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30 * 24  # 30 days
 
 security = HTTPBearer()
 
+# Shared async HTTP client for outbound email-provider calls; pooled
+# connections instead of a new TCP+TLS handshake per request
+http_client = httpx.AsyncClient(timeout=30)
+
 # Create the main app without a prefix
-app = FastAPI(title="ConnectVault CRM API")
+app = FastAPI(title="ConnectVault CRM API", default_response_class=ORJSONResponse)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
@@ -64,23 +104,46 @@ DEFAULT_SETTINGS = {
     }
 }
 
+# Parsed-settings cache, invalidated by file mtime so out-of-band edits to
+# settings.json are still picked up
+_settings_cache = (None, None)  # (mtime, settings)
+
+def _copy_settings(settings):
+    # callers mutate the result (admin masking, updates), so hand out a
+    # section-level copy rather than the cached dict itself
+    return {key: value.copy() if isinstance(value, dict) else value
+            for key, value in settings.items()}
+
+def _merge_defaults(settings):
+    # Flat dict-unpacking merge against the static template: stored values
+    # win, missing sections and subkeys fall back to defaults, and unknown
+    # keys (e.g. provider keys added later) pass through untouched
+    merged = {
+        key: {**default, **settings.get(key, {})} if isinstance(default, dict)
+        else settings.get(key, default)
+        for key, default in DEFAULT_SETTINGS.items()
+    }
+    for key, value in settings.items():
+        if key not in merged:
+            merged[key] = value
+    return merged
+
 def load_settings():
     """Load settings from file or return defaults"""
+    global _settings_cache
     try:
-        if SETTINGS_FILE.exists():
-            with open(SETTINGS_FILE, 'r') as f:
-                settings = json.load(f)
-                # Merge with defaults to ensure all keys exist
-                for key in DEFAULT_SETTINGS:
-                    if key not in settings:
-                        settings[key] = DEFAULT_SETTINGS[key]
-                    elif isinstance(DEFAULT_SETTINGS[key], dict):
-                        for subkey in DEFAULT_SETTINGS[key]:
-                            if subkey not in settings[key]:
-                                settings[key][subkey] = DEFAULT_SETTINGS[key][subkey]
-                return settings
-        else:
+        try:
+            mtime = SETTINGS_FILE.stat().st_mtime
+        except FileNotFoundError:
             return DEFAULT_SETTINGS.copy()
+
+        if _settings_cache[0] == mtime:
+            return _copy_settings(_settings_cache[1])
+
+        with open(SETTINGS_FILE, 'r') as f:
+            settings = _merge_defaults(json.load(f))
+        _settings_cache = (mtime, settings)
+        return _copy_settings(settings)
     except Exception as e:
         logging.error(f"Error loading settings: {e}")
         return DEFAULT_SETTINGS.copy()
@@ -95,14 +158,41 @@ def save_settings(settings):
         logging.error(f"Error saving settings: {e}")
         return False
 
+# Write debouncer: the settings UI fires several PUTs in a row, so coalesce
+# bursts into one disk write instead of rewriting the file per request
+_SETTINGS_WRITE_DELAY = 0.5  # seconds
+_pending_settings = None
+_settings_writer_task = None
+
+async def _flush_pending_settings():
+    global _pending_settings, _settings_writer_task
+    await asyncio.sleep(_SETTINGS_WRITE_DELAY)
+    settings, _pending_settings = _pending_settings, None
+    _settings_writer_task = None
+    if settings is not None:
+        await asyncio.to_thread(save_settings, settings)
+
+def schedule_save_settings(settings):
+    """Queue a settings write; bursts within the delay window coalesce."""
+    global _pending_settings, _settings_writer_task, _settings_cache
+    _pending_settings = settings
+    # serve the pending state from the read cache until the write lands
+    _settings_cache = (_settings_cache[0], settings)
+    if _settings_writer_task is None:
+        _settings_writer_task = asyncio.get_running_loop().create_task(_flush_pending_settings())
+
+def utcnow() -> datetime:
+    """Single timezone-aware clock read shared by models and handlers."""
+    return datetime.now(timezone.utc)
+
 # Models
 class User(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     full_name: str
     username: str
     email: EmailStr
     role: str = "user"
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=utcnow)
     is_active: bool = True
 
 class UserCreate(BaseModel):
@@ -132,13 +222,13 @@ class PasswordReset(BaseModel):
     confirm_password: str
 
 class Contact(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     user_id: str
     name: str
     email: str
     platform: str
     notes: str = ""
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=utcnow)
 
 class ContactCreate(BaseModel):
     name: str
@@ -147,19 +237,19 @@ class ContactCreate(BaseModel):
     notes: str = ""
 
 class PromoLink(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     user_id: str
     promo_name: str
     promo_link: str
     tracking_link: str = ""
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=utcnow)
 
 class PromoLinkCreate(BaseModel):
     promo_name: str
     promo_link: str
 
 class Commission(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     user_id: str
     program_name: str
     amount: float
@@ -168,8 +258,8 @@ class Commission(BaseModel):
     paid_date: Optional[datetime] = None
     promo_link_id: Optional[str] = None
     notes: str = ""
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=utcnow)
+    updated_at: datetime = Field(default_factory=utcnow)
 
 class CommissionCreate(BaseModel):
     program_name: str
@@ -180,6 +270,9 @@ class CommissionCreate(BaseModel):
     promo_link_id: Optional[str] = None
     notes: str = ""
 
+class CommissionBulkCreate(BaseModel):
+    commissions: List[CommissionCreate]
+
 class CommissionUpdate(BaseModel):
     program_name: Optional[str] = None
     amount: Optional[float] = None
@@ -190,14 +283,14 @@ class CommissionUpdate(BaseModel):
     notes: Optional[str] = None
 
 class Task(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     user_id: str
     contact_id: Optional[str] = None
     title: str
     description: str = ""
     status: str = "pending"  # pending, in_progress, done
     due_date: Optional[datetime] = None
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=utcnow)
 
 class TaskCreate(BaseModel):
     contact_id: Optional[str] = None
@@ -217,36 +310,145 @@ class SettingsUpdate(BaseModel):
     email_integration: Optional[Dict[str, str]] = None
 
 class FileRecord(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     user_id: str
     name: str
     category: str = "General"
     size_bytes: int
     mime_type: str
     storage_path: str
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=utcnow)
+    updated_at: datetime = Field(default_factory=utcnow)
 
 class FileUpdate(BaseModel):
     name: Optional[str] = None
     category: Optional[str] = None
 
+
 # Utility functions
+# Cost factor shared by hash and salt generation; tunable per deployment so
+# small instances can trade hash hardness for login latency
+BCRYPT_ROUNDS = int(os.environ.get("BCRYPT_ROUNDS", 12))
+
+def _password_bytes(password):
+    # bcrypt only reads the first 72 bytes; prehash longer inputs so the
+    # rest of the password still contributes to the hash
+    password_bytes = password.encode("utf-8")
+    if len(password_bytes) > 72:
+        password_bytes = hashlib.sha256(password_bytes).hexdigest().encode("ascii")
+    return password_bytes
+
+# Successful verifies are remembered so a credential re-presented within the
+# process lifetime (load tests, polling clients) skips the ~100ms bcrypt work.
+# Only the blake2b fingerprint of (password, hash) is kept, never the password
+_VERIFY_CACHE_MAX = 128
+_verify_cache = OrderedDict()
+# verify_password runs on to_thread workers, so cache access must be locked
+_verify_cache_lock = threading.Lock()
+
 def verify_password(plain_password, hashed_password):
-    return pwd_context.verify(plain_password, hashed_password)
+    password_bytes = _password_bytes(plain_password)
+    cache_key = hashlib.blake2b(
+        password_bytes + b"\x00" + hashed_password.encode("utf-8"),
+        digest_size=16
+    ).digest()
+    with _verify_cache_lock:
+        if cache_key in _verify_cache:
+            _verify_cache.move_to_end(cache_key)
+            return True
+    try:
+        verified = bcrypt.checkpw(password_bytes, hashed_password.encode("utf-8"))
+    except ValueError:
+        return False
+    if verified:
+        with _verify_cache_lock:
+            _verify_cache[cache_key] = True
+            if len(_verify_cache) > _VERIFY_CACHE_MAX:
+                _verify_cache.popitem(last=False)
+    return verified
 
 def get_password_hash(password):
-    return pwd_context.hash(password)
+    return bcrypt.hashpw(_password_bytes(password), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode("utf-8")
+
+# HS256 signing state prepared once at import: the header segment never
+# changes and the keyed HMAC is copy()'d per token instead of re-keying
+_JWT_HEADER_SEGMENT = base64.urlsafe_b64encode(
+    json.dumps({"alg": ALGORITHM, "typ": "JWT"}, separators=(",", ":")).encode("ascii")
+).rstrip(b"=")
+_JWT_HMAC_PROTOTYPE = hmac.new(SECRET_KEY.encode("utf-8"), digestmod=hashlib.sha256)
+
+def _b64url(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
     if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
+        expire = utcnow() + expires_delta
     else:
-        expire = datetime.now(timezone.utc) + timedelta(minutes=15)
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
-    return encoded_jwt
+        expire = utcnow() + timedelta(minutes=15)
+    to_encode.update({"exp": int(expire.timestamp())})
+    payload_segment = _b64url(json.dumps(to_encode, separators=(",", ":")).encode("utf-8"))
+    signing_input = _JWT_HEADER_SEGMENT + b"." + payload_segment
+    mac = _JWT_HMAC_PROTOTYPE.copy()
+    mac.update(signing_input)
+    return (signing_input + b"." + _b64url(mac.digest())).decode("ascii")
+
+# Only pull the fields the User model actually needs (notably not password_hash)
+USER_PROJECTION = {"_id": 0, "id": 1, "full_name": 1, "username": 1, "email": 1, "role": 1, "created_at": 1, "is_active": 1}
+
+# Signature verification is pure CPU work, so memoize decoded tokens.
+# Keyed by token digest (never the raw token); entries evict LRU or when
+# the stored expiry has passed, so revocation-by-expiry still holds.
+_TOKEN_CACHE_MAX = 1024
+_token_cache = OrderedDict()
+
+def _decode_token_cached(token: str) -> Optional[str]:
+    key = hashlib.sha256(token.encode("utf-8")).hexdigest()
+    now = time.time()  # avoid a datetime object on the per-request hot path
+    cached = _token_cache.get(key)
+    if cached is not None:
+        username, exp = cached
+        if exp > now:
+            _token_cache.move_to_end(key)
+            return username
+        del _token_cache[key]
+    payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    username = payload.get("sub")
+    if username is not None:
+        _token_cache[key] = (username, payload.get("exp", now))
+        if len(_token_cache) > _TOKEN_CACHE_MAX:
+            _token_cache.popitem(last=False)
+    return username
+
+# Coalesce concurrent lookups for the same subject (token storms from a
+# single client) into one Mongo query; the map only holds in-flight entries
+_user_lookup_futures = {}
+
+async def _get_user_doc(username: str):
+    future = _user_lookup_futures.get(username)
+    if future is not None:
+        # shield so one cancelled waiter doesn't cancel the shared future
+        return await asyncio.shield(future)
+
+    future = asyncio.get_running_loop().create_future()
+    _user_lookup_futures[username] = future
+    try:
+        doc = await db.users.find_one({"username": username}, USER_PROJECTION)
+        future.set_result(doc)
+        return doc
+    except BaseException as exc:
+        # Resolve before the pop below so shielded waiters never hang: a
+        # cancelled leader cancels the shared future, lookup errors are set
+        # on it (and marked retrieved here so a leader with no waiters
+        # doesn't log "exception was never retrieved")
+        if isinstance(exc, asyncio.CancelledError):
+            future.cancel()
+        else:
+            future.set_exception(exc)
+            future.exception()
+        raise
+    finally:
+        _user_lookup_futures.pop(username, None)
 
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
     credentials_exception = HTTPException(
@@ -255,16 +457,14 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        token = credentials.credentials
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        username: str = payload.get("sub")
+        username = _decode_token_cached(credentials.credentials)
         if username is None:
             raise credentials_exception
         token_data = TokenData(username=username)
-    except JWTError:
+    except jwt.InvalidTokenError:
         raise credentials_exception
     
-    user = await db.users.find_one({"username": token_data.username})
+    user = await _get_user_doc(token_data.username)
     if user is None:
         raise credentials_exception
     return User(**user)
@@ -280,45 +480,53 @@ async def get_admin_user(current_user: User = Depends(get_current_user)):
 # Authentication endpoints
 @api_router.post("/auth/register", response_model=dict)
 async def register_user(user: UserCreate):
-    # Check if username or email already exists
-    existing_user = await db.users.find_one({
-        "$or": [{"username": user.username}, {"email": user.email}]
-    })
-    if existing_user:
-        raise HTTPException(
-            status_code=400,
-            detail="Username or email already exists"
-        )
-    
-    # Hash password and create user
-    hashed_password = get_password_hash(user.password)
-    user_dict = user.dict()
+    # Hash password and create user (bcrypt is CPU-bound, keep it off the event loop)
+    hashed_password = await asyncio.to_thread(get_password_hash, user.password)
+    user_dict = user.model_dump()
     user_dict.pop("password")
     user_dict["role"] = user_dict["role"].lower()
-    
+
     user_obj = User(**user_dict)
-    user_data = user_obj.dict()
+    user_data = user_obj.model_dump()
     user_data["password_hash"] = hashed_password
-    
-    await db.users.insert_one(user_data)
+
+    # Let the unique indexes arbitrate instead of a racy $or pre-check;
+    # duplicates surface as a DuplicateKeyError on insert
+    try:
+        await db.users.insert_one(user_data)
+    except DuplicateKeyError:
+        raise HTTPException(
+            status_code=400,
+            detail="Username or email already exists"
+        )
     return {"message": "Account created successfully. Please log in"}
 
 @api_router.post("/auth/login", response_model=Token)
 async def login_user(user_credentials: UserLogin):
     # Find user by username
-    user = await db.users.find_one({"username": user_credentials.username})
-    if not user or not verify_password(user_credentials.password, user.get("password_hash", "")):
+    user = await db.users.find_one(
+        {"username": user_credentials.username},
+        {"_id": 0, "username": 1, "password_hash": 1, "role": 1}
+    )
+    if not user or not await asyncio.to_thread(verify_password, user_credentials.password, user.get("password_hash", "")):
         raise HTTPException(
             status_code=401,
             detail="Invalid username or password"
         )
     
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    # Embed the role so consumers can authorize from claims alone without
+    # an extra user lookup; the admin endpoints still re-check the live role
     access_token = create_access_token(
-        data={"sub": user["username"]}, expires_delta=access_token_expires
+        data={"sub": user["username"], "role": user.get("role", "user")},
+        expires_delta=access_token_expires
     )
     return {"access_token": access_token, "token_type": "bearer"}
 
+def _reset_token_fingerprint(token: str) -> bytes:
+    """Compact blake2b fingerprint of a reset token, used as the stored key."""
+    return hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+
 @api_router.post("/auth/forgot-password")
 async def forgot_password(request: PasswordResetRequest):
     # Find user by email or username
@@ -331,12 +539,13 @@ async def forgot_password(request: PasswordResetRequest):
     
     # Generate reset token (valid for 30 minutes)
     reset_token = secrets.token_urlsafe(32)
-    expire_time = datetime.now(timezone.utc) + timedelta(minutes=30)
-    
-    # Store reset token in database
-    await db.password_resets.insert_one({
+    expire_time = utcnow() + timedelta(minutes=30)
+
+    # Store only a fingerprint of the token: the indexed key stays a compact
+    # 16 bytes and a leaked database doesn't yield usable reset links
+    await password_resets_relaxed.insert_one({
         "user_id": user["id"],
-        "token": reset_token,
+        "token_hash": _reset_token_fingerprint(reset_token),
         "expires_at": expire_time,
         "used": False
     })
@@ -354,18 +563,18 @@ async def reset_password(reset_data: PasswordReset):
     if reset_data.new_password != reset_data.confirm_password:
         raise HTTPException(status_code=400, detail="Passwords do not match")
     
-    # Find valid reset token
-    reset_record = await db.password_resets.find_one({
-        "token": reset_data.token,
-        "used": False,
-        "expires_at": {"$gt": datetime.now(timezone.utc)}
-    })
-    
-    if not reset_record:
+    # Point lookup on the unique token_hash index; used/expiry checks are cheaper
+    # in Python than as extra filter clauses Mongo has to evaluate per match
+    reset_record = await db.password_resets.find_one(
+        {"token_hash": _reset_token_fingerprint(reset_data.token)}
+    )
+
+    if (not reset_record or reset_record.get("used")
+            or reset_record["expires_at"].replace(tzinfo=timezone.utc) <= utcnow()):
         raise HTTPException(status_code=400, detail="Invalid or expired reset token")
     
     # Update user password
-    new_password_hash = get_password_hash(reset_data.new_password)
+    new_password_hash = await asyncio.to_thread(get_password_hash, reset_data.new_password)
     await db.users.update_one(
         {"id": reset_record["user_id"]},
         {"$set": {"password_hash": new_password_hash}}
@@ -380,44 +589,99 @@ async def reset_password(reset_data: PasswordReset):
     return {"message": "Password reset successfully"}
 
 # Dashboard endpoints
+_day_bounds_cache = (None, None, None)  # (date, midnight, next midnight)
+
+def _day_bounds():
+    """Today's [midnight, midnight+1d) window, recomputed once per UTC day."""
+    global _day_bounds_cache
+    now = utcnow()
+    if _day_bounds_cache[0] != now.date():
+        today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        _day_bounds_cache = (now.date(), today, today + timedelta(days=1))
+    return _day_bounds_cache[1], _day_bounds_cache[2]
+
+def _etag_response(request: Request, payload, cache_control: str = "private, no-cache"):
+    """Serialize payload once, short-circuiting to 304 when the ETag matches."""
+    body = orjson.dumps(payload)
+    etag = f'"{hashlib.md5(body).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+# Summary responses tolerate a few seconds of staleness, so repeated hits
+# from the same user collapse to a dict lookup instead of an aggregation
+_DASHBOARD_CACHE_TTL = 5.0
+_DASHBOARD_CACHE_MAX = 1024
+_dashboard_cache = {}  # user_id -> (expires_at, payload)
+
 @api_router.get("/dashboard/summary")
-async def get_dashboard_summary(current_user: User = Depends(get_current_user)):
-    # Get summary data
-    total_contacts = await db.contacts.count_documents({"user_id": current_user.id})
-    
-    today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
-    tomorrow = today + timedelta(days=1)
-    tasks_due_today = await db.tasks.count_documents({
-        "user_id": current_user.id,
-        "due_date": {"$gte": today, "$lt": tomorrow},
-        "status": {"$ne": "done"}
-    })
-    
-    active_promo_links = await db.promo_links.count_documents({"user_id": current_user.id})
-    
-    # Commission summary
-    total_commissions = await db.commissions.aggregate([
+async def get_dashboard_summary(request: Request, current_user: User = Depends(get_current_user)):
+    now = time.time()
+    cached = _dashboard_cache.get(current_user.id)
+    if cached and cached[0] > now:
+        return _etag_response(request, cached[1])
+
+    today, tomorrow = _day_bounds()
+
+    # Single aggregation round-trip: union the per-collection matches, then
+    # split counts and commission totals with $facet
+    pipeline = [
         {"$match": {"user_id": current_user.id}},
-        {"$group": {
-            "_id": None,
-            "total_paid": {"$sum": {"$cond": [{"$eq": ["$status", "paid"]}, "$amount", 0]}},
-            "total_unpaid": {"$sum": {"$cond": [{"$eq": ["$status", "unpaid"]}, "$amount", 0]}},
-            "total_pending": {"$sum": {"$cond": [{"$eq": ["$status", "pending"]}, "$amount", 0]}}
+        {"$project": {"_id": 0, "kind": {"$literal": "contact"}}},
+        {"$unionWith": {"coll": "tasks", "pipeline": [
+            {"$match": {
+                "user_id": current_user.id,
+                "due_date": {"$gte": today, "$lt": tomorrow},
+                "status": {"$ne": "done"}
+            }},
+            {"$project": {"_id": 0, "kind": {"$literal": "task"}}}
+        ]}},
+        {"$unionWith": {"coll": "promo_links", "pipeline": [
+            {"$match": {"user_id": current_user.id}},
+            {"$project": {"_id": 0, "kind": {"$literal": "promo_link"}}}
+        ]}},
+        {"$unionWith": {"coll": "commissions", "pipeline": [
+            {"$match": {"user_id": current_user.id}},
+            {"$project": {"_id": 0, "kind": {"$literal": "commission"}, "status": 1, "amount": 1}}
+        ]}},
+        {"$facet": {
+            "counts": [
+                {"$group": {"_id": "$kind", "count": {"$sum": 1}}}
+            ],
+            "commission_totals": [
+                {"$match": {"kind": "commission"}},
+                {"$group": {
+                    "_id": None,
+                    "total_paid": {"$sum": {"$cond": [{"$eq": ["$status", "paid"]}, "$amount", 0]}},
+                    "total_unpaid": {"$sum": {"$cond": [{"$eq": ["$status", "unpaid"]}, "$amount", 0]}},
+                    "total_pending": {"$sum": {"$cond": [{"$eq": ["$status", "pending"]}, "$amount", 0]}}
+                }},
+                {"$project": {"_id": 0}}
+            ]
         }}
-    ]).to_list(1)
-    
-    commission_summary = total_commissions[0] if total_commissions else {"total_paid": 0, "total_unpaid": 0, "total_pending": 0}
-    
-    return {
-        "total_contacts": total_contacts,
-        "tasks_due_today": tasks_due_today,
-        "active_promo_links": active_promo_links,
+    ]
+
+    result = (await db.contacts.aggregate(pipeline).to_list(1))[0]
+    counts = {row["_id"]: row["count"] for row in result["counts"]}
+
+    commission_totals = result["commission_totals"]
+    commission_summary = commission_totals[0] if commission_totals else {"total_paid": 0, "total_unpaid": 0, "total_pending": 0}
+
+    payload = {
+        "total_contacts": counts.get("contact", 0),
+        "tasks_due_today": counts.get("task", 0),
+        "active_promo_links": counts.get("promo_link", 0),
         "commission_summary": commission_summary
     }
+    if len(_dashboard_cache) >= _DASHBOARD_CACHE_MAX:
+        _dashboard_cache.clear()
+    _dashboard_cache[current_user.id] = (now + _DASHBOARD_CACHE_TTL, payload)
+    return _etag_response(request, payload)
 
 # Settings endpoints
 @api_router.get("/settings")
-async def get_settings():
+async def get_settings(request: Request):
     """Get application settings (public data only)"""
     settings = load_settings()
     # Remove sensitive data
@@ -425,7 +689,7 @@ async def get_settings():
         "branding": settings["branding"],
         "quick_access_links": settings["quick_access_links"]
     }
-    return public_settings
+    return _etag_response(request, public_settings, cache_control="public, no-cache")
 
 @api_router.get("/settings/admin")
 async def get_admin_settings(current_user: User = Depends(get_admin_user)):
@@ -449,10 +713,8 @@ async def update_settings(settings_update: SettingsUpdate, current_user: User =
     if settings_update.email_integration:
         current_settings["email_integration"].update(settings_update.email_integration)
     
-    if save_settings(current_settings):
-        return {"message": "Settings updated successfully"}
-    else:
-        raise HTTPException(status_code=500, detail="Failed to save settings")
+    schedule_save_settings(current_settings)
+    return {"message": "Settings updated successfully"}
 
 # Email integration endpoints (Brevo)
 class TestEmail(BaseModel):
@@ -490,10 +752,8 @@ async def save_email_key(email_key: EmailApiKey, current_user: User = Depends(ge
     # In production, encrypt this key
     settings["email_integration"]["brevo_api_key"] = email_key.apiKey
     
-    if save_settings(settings):
-        return {"message": "Email API key saved successfully"}
-    else:
-        raise HTTPException(status_code=500, detail="Failed to save API key")
+    schedule_save_settings(settings)
+    return {"message": "Email API key saved successfully"}
 
 @api_router.post("/email/test")
 async def send_test_email(test_email: TestEmail, current_user: User = Depends(get_current_user)):
@@ -529,11 +789,10 @@ async def send_test_email(test_email: TestEmail, current_user: User = Depends(ge
     }
     
     try:
-        response = requests.post(
+        response = await http_client.post(
             "https://api.brevo.com/v3/smtp/email",
             headers=headers,
-            json=payload,
-            timeout=30
+            json=payload
         )
         
         if response.status_code in [200, 201]:
@@ -556,7 +815,7 @@ async def send_test_email(test_email: TestEmail, current_user: User = Depends(ge
                 detail="Failed to send email. Please check your API key and try again."
             )
     
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         logging.error(f"Brevo API request failed: {e}")
         raise HTTPException(
             status_code=500,
@@ -595,11 +854,10 @@ async def subscribe_email(subscriber: EmailSubscriber, current_user: User = Depe
         payload["groups"] = [group_id]
     
     try:
-        response = requests.post(
+        response = await http_client.post(
             "https://connect.mailerlite.com/api/subscribers",
             headers=headers,
-            json=payload,
-            timeout=30
+            json=payload
         )
         
         if response.status_code in [200, 201]:
@@ -614,7 +872,7 @@ async def subscribe_email(subscriber: EmailSubscriber, current_user: User = Depe
                 detail="Failed to add subscriber. Please check your information and try again."
             )
     
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         logging.error(f"MailerLite API request failed: {e}")
         raise HTTPException(
             status_code=500,
@@ -625,45 +883,55 @@ async def subscribe_email(subscriber: EmailSubscriber, current_user: User = Depe
 @api_router.get("/commissions", response_model=List[Commission])
 async def get_commissions(current_user: User = Depends(get_current_user)):
     """Get all commissions for current user"""
-    commissions = await db.commissions.find({"user_id": current_user.id}).to_list(length=None)
-    return [Commission(**commission) for commission in commissions]
+    commissions = await db.commissions.find({"user_id": current_user.id}, {"_id": 0}).to_list(length=None)
+    # these documents were validated on write, so skip re-validation on read
+    return [Commission.model_construct(**commission) for commission in commissions]
 
 @api_router.post("/commissions", response_model=Commission)
 async def create_commission(commission_data: CommissionCreate, current_user: User = Depends(get_current_user)):
     """Create a new commission"""
-    commission = Commission(**commission_data.dict(), user_id=current_user.id)
-    commission_dict = commission.dict()
+    commission = Commission(**commission_data.model_dump(), user_id=current_user.id)
+    commission_dict = commission.model_dump()
     await db.commissions.insert_one(commission_dict)
     return commission
 
+@api_router.post("/commissions/bulk", response_model=List[Commission])
+async def create_commissions_bulk(bulk_data: CommissionBulkCreate, current_user: User = Depends(get_current_user)):
+    """Create several commissions in a single insert_many round-trip"""
+    commissions = [
+        Commission(**item.model_dump(), user_id=current_user.id)
+        for item in bulk_data.commissions
+    ]
+    if commissions:
+        await db.commissions.insert_many([c.model_dump() for c in commissions])
+    return commissions
+
 @api_router.get("/commissions/{commission_id}", response_model=Commission)
 async def get_commission(commission_id: str, current_user: User = Depends(get_current_user)):
     """Get a specific commission"""
-    commission = await db.commissions.find_one({"id": commission_id, "user_id": current_user.id})
+    commission = await db.commissions.find_one({"id": commission_id, "user_id": current_user.id}, {"_id": 0})
     if not commission:
         raise HTTPException(status_code=404, detail="Commission not found")
-    return Commission(**commission)
+    return Commission.model_construct(**commission)
 
 @api_router.put("/commissions/{commission_id}", response_model=Commission)
 async def update_commission(commission_id: str, commission_update: CommissionUpdate, current_user: User = Depends(get_current_user)):
     """Update a commission"""
-    # Check if commission exists and belongs to user
-    existing = await db.commissions.find_one({"id": commission_id, "user_id": current_user.id})
-    if not existing:
-        raise HTTPException(status_code=404, detail="Commission not found")
-    
     # Update only provided fields
-    update_data = {k: v for k, v in commission_update.dict().items() if v is not None}
-    update_data["updated_at"] = datetime.now(timezone.utc)
-    
-    await db.commissions.update_one(
+    update_data = {k: v for k, v in commission_update.model_dump().items() if v is not None}
+    update_data["updated_at"] = utcnow()
+
+    # One round-trip: update and fetch the new document atomically; a miss
+    # doubles as the existence/ownership check
+    updated = await db.commissions.find_one_and_update(
         {"id": commission_id, "user_id": current_user.id},
-        {"$set": update_data}
+        {"$set": update_data},
+        projection={"_id": 0},
+        return_document=ReturnDocument.AFTER
     )
-    
-    # Return updated commission
-    updated = await db.commissions.find_one({"id": commission_id, "user_id": current_user.id})
-    return Commission(**updated)
+    if not updated:
+        raise HTTPException(status_code=404, detail="Commission not found")
+    return Commission.model_construct(**updated)
 
 @api_router.delete("/commissions/{commission_id}")
 async def delete_commission(commission_id: str, current_user: User = Depends(get_current_user)):
@@ -676,19 +944,48 @@ async def delete_commission(commission_id: str, current_user: User = Depends(get
 @api_router.get("/commissions/export/csv")
 async def export_commissions_csv(current_user: User = Depends(get_current_user)):
     """Export commissions as CSV"""
-    commissions = await db.commissions.find({"user_id": current_user.id}).to_list(length=None)
-    
-    # Convert to CSV format
-    csv_data = "Program Name,Amount,Status,Expected Date,Paid Date,Notes,Created At\n"
-    for commission in commissions:
-        csv_data += f"{commission.get('program_name', '')},{commission.get('amount', 0)},{commission.get('status', '')},{commission.get('expected_date', '') or ''},{commission.get('paid_date', '') or ''},{commission.get('notes', '').replace(',', ';')},{commission.get('created_at', '')}\n"
-    
-    return {"csv_data": csv_data}
+    async def generate_csv():
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(["Program Name", "Amount", "Status", "Expected Date", "Paid Date", "Notes", "Created At"])
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+
+        # Rows are written out as the cursor delivers them instead of
+        # accumulating the whole export in one string
+        export_fields = {"_id": 0, "program_name": 1, "amount": 1, "status": 1,
+                         "expected_date": 1, "paid_date": 1, "notes": 1, "created_at": 1}
+        async for commission in db.commissions.find({"user_id": current_user.id}, export_fields):
+            writer.writerow([
+                commission.get('program_name', ''),
+                commission.get('amount', 0),
+                commission.get('status', ''),
+                commission.get('expected_date', '') or '',
+                commission.get('paid_date', '') or '',
+                commission.get('notes', ''),
+                commission.get('created_at', '')
+            ])
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+
+    return StreamingResponse(
+        generate_csv(),
+        media_type="text/csv",
+        headers={"Content-Disposition": 'attachment; filename="commissions.csv"'}
+    )
 
 # File management endpoints
 UPLOAD_DIR = ROOT_DIR / "uploads"
 UPLOAD_DIR.mkdir(exist_ok=True)
 
+MAX_UPLOAD_BYTES = 10 * 1024 * 1024  # 10MB
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Anything outside this safe set is stripped from stored filenames
+_FILENAME_SANITIZE_RE = re.compile(r"[^A-Za-z0-9._-]+")
+
 @api_router.post("/files", response_model=FileRecord)
 async def upload_file(
     file: UploadFile = File(...),
@@ -710,40 +1007,46 @@ async def upload_file(
             detail="Only PDF, DOCX, TXT, XLS, and XLSX files are allowed"
         )
     
-    # Check file size (10MB max)
-    file_content = await file.read()
-    if len(file_content) > 10 * 1024 * 1024:  # 10MB
-        raise HTTPException(
-            status_code=400,
-            detail="File size must be less than 10MB"
-        )
-    
     # Sanitize filename
-    safe_filename = "".join(c for c in file.filename if c.isalnum() or c in "._-").strip()
+    safe_filename = _FILENAME_SANITIZE_RE.sub("", file.filename).strip()
     if not safe_filename:
-        safe_filename = f"file_{int(datetime.now(timezone.utc).timestamp())}.pdf"
-    
+        safe_filename = f"file_{int(utcnow().timestamp())}.pdf"
+
     # Create unique filename
-    file_id = str(uuid.uuid4())
+    file_id = uuid.uuid4().hex
     storage_filename = f"{file_id}_{safe_filename}"
     storage_path = UPLOAD_DIR / storage_filename
-    
-    # Save file
-    async with aiofiles.open(storage_path, 'wb') as f:
-        await f.write(file_content)
-    
+
+    # Stream to disk in chunks, enforcing the 10MB cap as bytes arrive
+    # instead of buffering the whole upload in memory first
+    size_bytes = 0
+    try:
+        async with aiofiles.open(storage_path, 'wb') as f:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                size_bytes += len(chunk)
+                if size_bytes > MAX_UPLOAD_BYTES:
+                    raise HTTPException(
+                        status_code=400,
+                        detail="File size must be less than 10MB"
+                    )
+                await f.write(chunk)
+    except HTTPException:
+        # drop the partial file before propagating the 400
+        storage_path.unlink(missing_ok=True)
+        raise
+
     # Create file record
     file_record = FileRecord(
         user_id=current_user.id,
         name=file.filename,
         category=category,
-        size_bytes=len(file_content),
+        size_bytes=size_bytes,
         mime_type=file.content_type,
         storage_path=str(storage_path)
     )
     
     # Save to database
-    await db.files.insert_one(file_record.dict())
+    await db.files.insert_one(file_record.model_dump())
     
     return file_record
 
@@ -751,32 +1054,39 @@ async def upload_file(
 async def get_files(
     search: Optional[str] = None,
     category: Optional[str] = None,
+    ids: Optional[str] = None,
     page: int = 1,
     limit: int = 10,
     current_user: User = Depends(get_current_user)
 ):
     """Get files for current user with search and filter"""
     query = {"user_id": current_user.id}
-    
+
     # Add search filter
     if search:
         query["name"] = {"$regex": search, "$options": "i"}
-    
+
     # Add category filter
     if category:
         query["category"] = category
+
+    # Restrict to specific IDs (comma-separated) so clients checking known
+    # records don't pull the whole listing
+    if ids:
+        query["id"] = {"$in": ids.split(",")}
     
     # Calculate skip for pagination
     skip = (page - 1) * limit
     
     # Get files
-    files = await db.files.find(query).skip(skip).limit(limit).sort("created_at", -1).to_list(length=None)
-    
-    return [FileRecord(**file) for file in files]
+    files = await db.files.find(query, {"_id": 0}).skip(skip).limit(limit).sort("created_at", -1).to_list(length=None)
+
+    return [FileRecord.model_construct(**file) for file in files]
 
 @api_router.get("/files/{file_id}/download")
 async def download_file(
     file_id: str,
+    request: Request,
     current_user: User = Depends(get_current_user)
 ):
     """Download a file"""
@@ -784,16 +1094,27 @@ async def download_file(
     file_record = await db.files.find_one({"id": file_id, "user_id": current_user.id})
     if not file_record:
         raise HTTPException(status_code=404, detail="File not found")
-    
-    # Check if file exists on disk
+
+    # Check if file exists on disk (single stat() instead of exists() + re-stat)
     storage_path = Path(file_record["storage_path"])
-    if not storage_path.exists():
+    try:
+        stat_result = storage_path.stat()
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail="File not found on disk")
-    
+
+    # FileResponse only emits the ETag (derived from mtime+size); the
+    # conditional-GET short-circuit has to happen here, using the same
+    # derivation so it matches the header cached clients hold
+    etag_base = f"{stat_result.st_mtime}-{stat_result.st_size}"
+    etag = f'"{hashlib.md5(etag_base.encode()).hexdigest()}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+
     return FileResponse(
         path=storage_path,
         filename=file_record["name"],
-        media_type=file_record["mime_type"]
+        media_type=file_record["mime_type"],
+        stat_result=stat_result
     )
 
 @api_router.patch("/files/{file_id}", response_model=FileRecord)
@@ -803,23 +1124,19 @@ async def update_file(
     current_user: User = Depends(get_current_user)
 ):
     """Update file metadata (rename, change category)"""
-    # Check if file exists and belongs to user
-    existing = await db.files.find_one({"id": file_id, "user_id": current_user.id})
-    if not existing:
-        raise HTTPException(status_code=404, detail="File not found")
-    
     # Update only provided fields
-    update_dict = {k: v for k, v in update_data.dict().items() if v is not None}
-    update_dict["updated_at"] = datetime.now(timezone.utc)
-    
-    await db.files.update_one(
+    update_dict = {k: v for k, v in update_data.model_dump().items() if v is not None}
+    update_dict["updated_at"] = utcnow()
+
+    updated = await db.files.find_one_and_update(
         {"id": file_id, "user_id": current_user.id},
-        {"$set": update_dict}
+        {"$set": update_dict},
+        projection={"_id": 0},
+        return_document=ReturnDocument.AFTER
     )
-    
-    # Return updated file
-    updated = await db.files.find_one({"id": file_id, "user_id": current_user.id})
-    return FileRecord(**updated)
+    if not updated:
+        raise HTTPException(status_code=404, detail="File not found")
+    return FileRecord.model_construct(**updated)
 
 @api_router.delete("/files/{file_id}")
 async def delete_file(
@@ -845,15 +1162,19 @@ async def delete_file(
     return {"message": "File deleted successfully"}
 
 @api_router.get("/files/categories")
-async def get_file_categories(current_user: User = Depends(get_current_user)):
+async def get_file_categories(request: Request, current_user: User = Depends(get_current_user)):
     """Get all categories used by user"""
     categories = await db.files.distinct("category", {"user_id": current_user.id})
-    return {"categories": categories}
+    return _etag_response(request, {"categories": categories})
 
 # Health check
+# Body serialized once at import; liveness probes hit this constantly and
+# shouldn't pay serialization (or any I/O) per call
+_HEALTH_BODY = orjson.dumps({"status": "ok"})
+
 @api_router.get("/health")
 async def health_check():
-    return {"status": "ok"}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 # Test endpoint
 @api_router.get("/")
@@ -866,11 +1187,15 @@ app.include_router(api_router)
 app.add_middleware(
     CORSMiddleware,
     allow_credentials=True,
-    allow_origins=os.environ.get('CORS_ORIGINS', '*').split(','),
+    allow_origins=CORS_ORIGINS,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
+# Compress larger JSON responses (list endpoints, CSV exports); small
+# payloads below the threshold are passed through untouched
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -878,6 +1203,27 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@app.on_event("startup")
+async def create_indexes():
+    # Unique indexes back the auth lookups and enforce uniqueness server-side
+    await db.users.create_index("username", unique=True)
+    await db.users.create_index("email", unique=True)
+    await db.password_resets.create_index("token_hash", unique=True)
+    # TTL index: Mongo reaps reset documents once expires_at passes, so the
+    # collection stays bounded without an external store
+    await db.password_resets.create_index("expires_at", expireAfterSeconds=0)
+    # Compound indexes matching the per-user access patterns: id lookups on
+    # the CRUD endpoints and created_at-sorted listings
+    for collection in (db.commissions, db.files):
+        await collection.create_index([("user_id", 1), ("id", 1)])
+        await collection.create_index([("user_id", 1), ("created_at", -1)])
+    # lets the /files/categories distinct() run as a covered DISTINCT_SCAN
+    await db.files.create_index([("user_id", 1), ("category", 1)])
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
+    # flush any settings write still sitting in the debounce window
+    if _pending_settings is not None:
+        save_settings(_pending_settings)
+    await http_client.aclose()
     client.close()
\ No newline at end of file